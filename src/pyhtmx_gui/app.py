@@ -7,7 +7,6 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from ovos_workshop.filesystem import FileSystemAccess
 from starlette.responses import Response, HTMLResponse, StreamingResponse
-from copy import deepcopy
 from time import time
 from threading import Lock, Thread
 from secrets import token_hex
@@ -106,10 +105,10 @@ Thread(target=check_disconnected, daemon=True).start()
 @app.get("/updates")
 async def updates() -> StreamingResponse:
     # Define message streaming generator
-    def stream() -> Iterator[str]:
-        messages = global_sender.listen()  # returns a queue.Queue
+    def stream() -> Iterator[bytes]:
+        messages = global_sender.listen()  # returns a Mailbox
         while True:
-            msg = messages.get()  # blocks until a new message arrives
+            msg = messages.get()  # blocks until new messages arrive
             # logger.debug(f"Sending message:\n{msg}")
             yield msg
     return StreamingResponse(
@@ -164,7 +163,7 @@ async def ping(session_id: str) -> Response:
 @app.get("/")
 async def root() -> HTMLResponse:
     session_id = token_hex(4)
-    document = deepcopy(global_renderer.document)
+    document = global_renderer.clone_document()
     session_element = document.find_element_by_id("session-id")
     if session_element:
         session_element.update_attributes(
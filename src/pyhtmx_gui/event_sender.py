@@ -1,21 +1,85 @@
 from __future__ import annotations
-from queue import Queue, Full
+from typing import Optional, List, Tuple, Dict, Hashable, Iterable, FrozenSet
+from queue import Full
+from threading import Condition
+
+
+DATA_PREFIX: bytes = b"data: "
+
+
+def format_message_prefix(event_id: Optional[str]) -> bytes:
+    # SSE header lines preceding the message data
+    if event_id is None:
+        return DATA_PREFIX
+    return f"event: {event_id}\ndata: ".encode()
+
+
+ROOT_PREFIX: bytes = format_message_prefix("root")
+DIALOG_PREFIX: bytes = format_message_prefix("dialog")
+# Swaps that replace a whole region, so only the latest one matters;
+# other events may rely on every message (e.g. restarting an animation)
+COALESCED_PREFIXES: FrozenSet[bytes] = frozenset((ROOT_PREFIX, DIALOG_PREFIX))
+
+
+def format_message(prefix: bytes, data: str) -> bytes:
+    # SSE data lines cannot contain newlines
+    return b"".join((prefix, data.encode().translate(None, b"\n"), b"\n\n"))
+
+
+class Mailbox:
+    def __init__(self: Mailbox, max_size: int = 10):
+        self._max_size: int = max_size
+        # Undelivered messages in the order they were first queued
+        self._pending: Dict[Hashable, bytes] = {}
+        self._backlog: int = 0
+        self._ready: Condition = Condition()
+
+    def put_many(self: Mailbox, items: Iterable[Tuple[bytes, bytes]]) -> None:
+        with self._ready:
+            # Too many sends without a read means the connection is gone
+            if self._backlog >= self._max_size:
+                raise Full
+            self._backlog += 1
+            for prefix, msg in items:
+                # A pending root or dialog swap is overwritten in place, so
+                # later swaps into the new content still follow it
+                key: Hashable = (
+                    prefix if prefix in COALESCED_PREFIXES else object()
+                )
+                self._pending[key] = msg
+            self._ready.notify()
+
+    def get(self: Mailbox) -> bytes:
+        # Block until something is pending, then take all of it at once
+        with self._ready:
+            while not self._pending:
+                self._ready.wait()
+            data = b"".join(self._pending.values())
+            self._pending.clear()
+            self._backlog = 0
+        return data
 
 
 class EventSender:
     def __init__(self: EventSender, max_size: int = 10):
         self._max_size: int = max_size
-        self._listeners: list[Queue] = []
+        self._listeners: list[Mailbox] = []
+
+    def listen(self: EventSender) -> Mailbox:
+        mailbox = Mailbox(max_size=self._max_size)
+        self._listeners.append(mailbox)
+        return mailbox
 
-    def listen(self: EventSender) -> Queue:
-        q = Queue(maxsize=self._max_size)
-        self._listeners.append(q)
-        return q
+    def send(self: EventSender, prefix: bytes, msg: bytes) -> None:
+        self.send_many([(prefix, msg)])
 
-    def send(self: EventSender, msg: str) -> None:
+    def send_many(self: EventSender, msgs: List[Tuple[bytes, bytes]]) -> None:
+        # The same message objects are posted to every listener
+        if not msgs:
+            return
         for listener in reversed(self._listeners):
             try:
-                listener.put_nowait(msg)
+                listener.put_many(msgs)
             except Full:
                 # Connection closed, remove listener
                 self._listeners.remove(listener)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 import os
-from typing import Any, Union, Optional, List, Dict
-from secrets import token_hex
+from typing import Any, Union, Optional, List, Dict, Tuple
+from collections import OrderedDict
+from threading import Lock
 from pyhtmx.html_tag import HTMLTag
 from .types import PageItem, InputItem, OutputItem, CallbackContext, EventType, DOMEvent
 from .renderer import Renderer, global_renderer
 from .page_group import PageGroup
+from .page_manager import PageManager
+from .kit import ID_COUNTER
 from .utils import validate_position, fix_position
 from .logger import logger
 
@@ -17,8 +20,14 @@ class GUIManager:
     renderer: Renderer = global_renderer
 
     def __init__(self: GUIManager) -> None:
-        self._namespaces: List[str] = []
+        # Namespaces ordered from the active one down the display stack
+        self._namespaces: OrderedDict[str, None] = OrderedDict()
+        # Copy-on-write: readers use the current mapping without locking,
+        # writers publish a new one under the catalog lock
         self._catalog: Dict[str, PageGroup] = {}
+        # Page managers by route, published along with the catalog
+        self._page_managers: Dict[Tuple[str, str], PageManager] = {}
+        self._catalog_lock: Lock = Lock()
         self._gui_client: Any = None
         GUIManager.renderer.set_gui_manager(self)
 
@@ -34,62 +43,85 @@ class GUIManager:
         namespace: Optional[str] = None,
     ) -> Optional[int]:
         namespace = namespace or self.get_active_namespace()
-        if not self.in_catalog(namespace):  # type: ignore
+        page_group = self._catalog.get(namespace)  # type: ignore
+        if page_group is None:
             return None
-        return self._catalog[namespace].num_pages  # type: ignore
+        return page_group.num_pages
 
     def in_catalog(self: GUIManager, namespace: str) -> bool:
         return namespace in self._catalog
 
     def in_page_group(self: GUIManager, namespace: str, page_id: str) -> bool:
-        return (
-            self.in_catalog(namespace) and
-            self._catalog[namespace].in_group(page_id)
-        )
+        page_group = self._catalog.get(namespace)
+        return page_group is not None and page_group.in_group(page_id)
+
+    def get_page_manager(
+        self: GUIManager,
+        namespace: str,
+        page_id: str,
+    ) -> Optional[PageManager]:
+        return self._page_managers.get((namespace, page_id))
 
     def get_active_namespace(
         self: GUIManager,
     ) -> Optional[str]:
-        if not self._namespaces:
-            return None
-        return self._namespaces[0]
+        return next(iter(self._namespaces), None)
 
     def activate_namespace(
         self: GUIManager,
         namespace: str,
     ) -> None:
-        if namespace in self._namespaces:
-            index = self._namespaces.index(namespace)
-            self._namespaces.pop(index)
-        self._namespaces.insert(0, namespace)
+        self._namespaces[namespace] = None
+        self._namespaces.move_to_end(namespace, last=False)
 
     def deactivate_namespace(
         self: GUIManager,
     ) -> None:
-        if not self._namespaces:
+        if len(self._namespaces) < 2:
             return
-        namespace = self._namespaces.pop(0)
-        self._namespaces.insert(1, namespace)
+        # Swap the active namespace with the next one
+        namespace, _ = self._namespaces.popitem(last=False)
+        next_namespace = next(iter(self._namespaces))
+        self._namespaces[namespace] = None
+        self._namespaces.move_to_end(namespace, last=False)
+        self._namespaces.move_to_end(next_namespace, last=False)
 
     def insert_namespace(
         self: GUIManager,
         namespace: str,
         position: int,
     ) -> None:
-        if namespace in self._namespaces:
-            index = self._namespaces.index(namespace)
-            self._namespaces.pop(index)
+        self._namespaces.pop(namespace, None)
         # Validate position
         if not validate_position(position, self.num_namespaces):
             position = fix_position(position, self.num_namespaces)
         # Insert
-        self._namespaces.insert(position, namespace)
+        if position == 0:
+            self.activate_namespace(namespace)
+        else:
+            namespaces = list(self._namespaces)
+            namespaces.insert(position, namespace)
+            self._namespaces = OrderedDict.fromkeys(namespaces)
         # Add page group
-        if not self.in_catalog(namespace):
-            self._catalog[namespace] = PageGroup(
-                namespace=namespace,
-                renderer=GUIManager.renderer,
-            )
+        self.get_or_create_page_group(namespace)
+
+    def get_or_create_page_group(
+        self: GUIManager,
+        namespace: str,
+    ) -> PageGroup:
+        page_group = self._catalog.get(namespace)
+        if page_group is not None:
+            return page_group
+        with self._catalog_lock:
+            # Check again in case another writer got here first
+            page_group = self._catalog.get(namespace)
+            if page_group is None:
+                page_group = PageGroup(
+                    namespace=namespace,
+                    renderer=GUIManager.renderer,
+                )
+                self._catalog = {**self._catalog, namespace: page_group}
+        return page_group
 
     def remove_namespace(
         self: GUIManager,
@@ -98,15 +130,27 @@ class GUIManager:
         if namespace in self._namespaces:
             if namespace == self.get_active_namespace():
                 self.close(namespace=namespace)
-            self._namespaces.remove(namespace)
+            self._namespaces.pop(namespace, None)
         else:
             logger.info(
                 f"Namespace '{namespace}' no longer exists. "
                 "Nothing to remove."
             )
         # Remove from catalog
-        if self.in_catalog(namespace):
-            del self._catalog[namespace]
+        if not self.in_catalog(namespace):
+            return
+        with self._catalog_lock:
+            self._catalog = {
+                key: page_group
+                for key, page_group in self._catalog.items()
+                if key != namespace
+            }
+            self._page_managers = {
+                route: page_manager
+                for route, page_manager in self._page_managers.items()
+                if route[0] != namespace
+            }
+        GUIManager.renderer.invalidate_render_cache(namespace)
 
     def insert_pages(
         self: GUIManager,
@@ -115,14 +159,9 @@ class GUIManager:
         session_data: Dict[str, Any],
         position: int,
     ) -> None:
-        if not self.in_catalog(namespace):
-            self._catalog[namespace] = PageGroup(
-                namespace=namespace,
-                renderer=GUIManager.renderer,
-            )
+        page_group = self.get_or_create_page_group(namespace)
         prefix = namespace.replace('.', '_')
         for item in reversed(page_args):
-            token = token_hex(4)
             url = item.get("url", "")
             if not url:
                 url = os.path.join(CLIENT_DIR, "not_implemented_page.py")
@@ -131,12 +170,18 @@ class GUIManager:
                         "namespace": namespace.split(".")[0],
                     }
                 )
-            self._catalog[namespace].insert_page(
-                page_id=item.get("page", f"{prefix}_{token}"),
+            page_id = item.get("page", f"{prefix}_{next(ID_COUNTER):08x}")
+            page_manager = page_group.insert_page(
+                page_id=page_id,
                 uri=url,
                 session_data=session_data,
                 position=position,
             )
+            with self._catalog_lock:
+                self._page_managers = {
+                    **self._page_managers,
+                    (namespace, page_id): page_manager,
+                }
         if set(self._namespaces) == {namespace}:
             self.show(namespace, id=0)
 
@@ -146,7 +191,8 @@ class GUIManager:
         position: int,
         items_number: int = 1,
     ) -> None:
-        if not self.in_catalog(namespace):
+        page_group = self._catalog.get(namespace)
+        if page_group is None:
             logger.warning(
                 f"Page group for '{namespace}' not in catalog. "
                 "Nothing to remove."
@@ -154,9 +200,18 @@ class GUIManager:
             return
         # Remove pages
         for _ in range(items_number):
-            if position == self._catalog[namespace].get_active_page_index():
+            if position == page_group.get_active_page_index():
                 self.close(namespace, id=position)
-            self._catalog[namespace].remove_page(position)
+            page_id = page_group.remove_page(position)
+            if page_id is None:
+                continue
+            with self._catalog_lock:
+                self._page_managers = {
+                    route: page_manager
+                    for route, page_manager in self._page_managers.items()
+                    if route != (namespace, page_id)
+                }
+            GUIManager.renderer.invalidate_render_cache(namespace, page_id)
 
     def move_pages(
         self: GUIManager,
@@ -165,7 +220,8 @@ class GUIManager:
         to_position: int,
         items_number: int = 1,
     ) -> None:
-        if not self.in_catalog(namespace):
+        page_group = self._catalog.get(namespace)
+        if page_group is None:
             logger.warning(
                 f"Page group for '{namespace}' not in catalog. "
                 "Nothing to move."
@@ -173,7 +229,7 @@ class GUIManager:
             return
         # Move pages
         for _ in range(items_number):
-            self._catalog[namespace].move_page(
+            page_group.move_page(
                 from_position,
                 to_position,
             )
@@ -183,60 +239,66 @@ class GUIManager:
         namespace: Optional[str] = None,
     ) -> Optional[int]:
         namespace = namespace or self.get_active_namespace()
-        if not self.in_catalog(namespace):  # type: ignore
+        page_group = self._catalog.get(namespace)  # type: ignore
+        if page_group is None:
             return None
-        return self._catalog[namespace].get_active_page_index()  # type: ignore
+        return page_group.get_active_page_index()
 
     def get_active_page_id(
         self: GUIManager,
         namespace: Optional[str] = None,
     ) -> Optional[str]:
         namespace = namespace or self.get_active_namespace()
-        if not self.in_catalog(namespace):  # type: ignore
+        page_group = self._catalog.get(namespace)  # type: ignore
+        if page_group is None:
             return None
-        return self._catalog[namespace].get_active_page_id()  # type: ignore
+        return page_group.get_active_page_id()
 
     def get_active_page(
         self: GUIManager,
         namespace: str,
     ) -> Optional[Any]:
-        if not self.in_catalog(namespace):
+        page_group = self._catalog.get(namespace)
+        if page_group is None:
             return None
-        return self._catalog[namespace].get_active_page()
+        return page_group.get_active_page()
 
     def get_active_page_tag(
         self: GUIManager,
         namespace: str,
     ) -> Optional[HTMLTag]:
-        if not self.in_catalog(namespace):
+        page_group = self._catalog.get(namespace)
+        if page_group is None:
             return None
-        return self._catalog[namespace].get_active_page_tag()
+        return page_group.get_active_page_tag()
 
     def activate_page(
         self: GUIManager,
         namespace: str,
         id: Union[int, str],
     ) -> None:
-        if not self.in_catalog(namespace):
+        page_group = self._catalog.get(namespace)
+        if page_group is None:
             logger.warning(
                 f"Page group for '{namespace}' not in catalog. "
                 "Nothing to move."
             )
             return
         self.activate_namespace(namespace)
-        self._catalog[namespace].activate_page(id)
+        page_group.activate_page(id)
 
     def deactivate_page(
         self: GUIManager,
         namespace: str,
     ) -> None:
-        if not self.in_catalog(namespace):
+        page_group = self._catalog.get(namespace)
+        if page_group is None:
             logger.warning(
                 f"Page group for '{namespace}' not in catalog. "
                 "Nothing to move."
             )
             return
-        self._catalog[namespace].deactivate_page()
+        page_group.deactivate_page()
 
     def show(
         self: GUIManager,
@@ -278,13 +340,14 @@ class GUIManager:
         key: str,
         value: InputItem,
     ) -> None:
-        if not self.in_catalog(namespace):
+        page_group = self._catalog.get(namespace)
+        if page_group is None:
             logger.warning(
                 f"Page group for '{namespace}' not in catalog. "
                 "Item will not be added."
             )
             return
-        return self._catalog[namespace].add_item(
+        return page_group.add_item(
             page_id=page_id,
             item_type=item_type,
             key=key,
@@ -298,17 +361,14 @@ class GUIManager:
         item_type: PageItem,
         key: str,
     ) -> Optional[OutputItem]:
-        if not self.in_catalog(namespace):
+        page_manager = self.get_page_manager(namespace, page_id)
+        if page_manager is None:
             logger.warning(
-                f"Page group for '{namespace}' not in catalog. "
+                f"Page '{namespace}::{page_id}' not in catalog. "
                 "Item will not be retrieved."
             )
             return
-        return self._catalog[namespace].get_item(
-            page_id=page_id,
-            item_type=item_type,
-            key=key,
-        )
+        return page_manager.get_item(item_type=item_type, key=key)
 
     def update_status(
         self: GUIManager,
@@ -326,16 +386,17 @@ class GUIManager:
         namespace: str,
         session_data: Dict[str, Any],
     ) -> None:
-        if not self.in_catalog(namespace):
+        page_group = self._catalog.get(namespace)
+        if page_group is None:
             logger.warning(
                 f"Page group for '{namespace}' not in catalog. "
                 "Nothing to update."
             )
             return
         # Update data
-        page_id = self._catalog[namespace].get_active_page_id()
+        page_id = page_group.get_active_page_id()
         if page_id:
-            self._catalog[namespace].update_data(
+            page_group.update_data(
                 page_id=page_id,
                 session_data=session_data,
             )
@@ -345,16 +406,17 @@ class GUIManager:
         namespace: str,
         ovos_event: str,
     ) -> None:
-        if not self.in_catalog(namespace):
+        page_group = self._catalog.get(namespace)
+        if page_group is None:
             logger.warning(
                 f"Page group for '{namespace}' not in catalog. "
                 "Nothing to update."
             )
             return
         # Update event
-        page_id = self._catalog[namespace].get_active_page_id()
+        page_id = page_group.get_active_page_id()
         if page_id:
-            self._catalog[namespace].update_state(
+            page_group.update_state(
                 page_id=page_id,
                 ovos_event=ovos_event,
             )
@@ -366,15 +428,22 @@ class GUIManager:
         event: Optional[DOMEvent] = None,
     ) -> Any:
         namespace = self.get_active_namespace()
-        page_id = self.get_active_page_id()
+        page_id = self.get_active_page_id(namespace)
         if namespace is None or page_id is None:
             logger.warning(
                 "No active namespace or page. "
                 "No callback will be triggered."
             )
             return
-        self._catalog[namespace].trigger_callback(
-            page_id=page_id,
+        # Callbacks only fire for the active page
+        page_manager = self.get_page_manager(namespace, page_id)
+        if page_manager is None:
+            logger.warning(
+                f"Page '{namespace}::{page_id}' not in catalog. "
+                "No callback will be triggered."
+            )
+            return
+        return page_manager.trigger_callback(
             context=context,
             event_id=event_id,
             event=event,
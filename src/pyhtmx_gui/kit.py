@@ -1,13 +1,19 @@
 from __future__ import annotations
-from typing import Any, Tuple, Dict, List, Optional, Callable, Union
+from typing import Any, Tuple, Dict, List, Optional, Callable, Union, Iterator
 from enum import Enum
 from pydantic import BaseModel, ConfigDict
 from secrets import token_hex
 from functools import partial
+from itertools import count
 from pyhtmx.html_tag import HTMLTag
 from .logger import logger
 
 
+# Ids only need to be unique within the process; the random seed keeps
+# them from repeating across restarts for clients still holding old pages
+ID_COUNTER: Iterator[int] = count(int(token_hex(4), 16))
+
+
 class Registrable(BaseModel):
     model_config = ConfigDict(
         strict=False,
@@ -66,7 +72,7 @@ class Widget:
         session_data: Optional[Dict[str, Any]] = None,
     ):
         self._type: WidgetType = type
-        self._name: str = name or f"widget-{token_hex(4)}"
+        self._name: str = name or f"widget-{next(ID_COUNTER):08x}"
         self._session_data: Dict[str, Any] = (
             dict.fromkeys(self._parameters, '')
         )
@@ -245,7 +251,7 @@ class Page(Widget):
     ):
         super().__init__(
             type=WidgetType.PAGE,
-            name=name or f"page-{token_hex(4)}",
+            name=name or f"page-{next(ID_COUNTER):08x}",
             session_data=session_data,
         )
         self._namespace: str = f"{self.id}-ns"
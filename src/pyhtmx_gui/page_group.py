@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import Any, Union, Optional, List, Dict
-from pydantic import BaseModel, ConfigDict, PrivateAttr
+from typing import Any, Union, Optional, Dict, Deque
+from collections import deque
+from threading import Lock
 from pyhtmx.html_tag import HTMLTag
 from .types import PageItem, InputItem, OutputItem, CallbackContext, DOMEvent
 from .utils import validate_position, fix_position
@@ -9,20 +10,30 @@ from .renderer import Renderer
 from .logger import logger
 
 
-class PageGroup(BaseModel):
-    model_config = ConfigDict(strict=False, arbitrary_types_allowed=True)
-    namespace: str
-    renderer: Renderer
-    _page_ids: List[str] = PrivateAttr([])
-    _pages: Dict[str, PageManager] = PrivateAttr({})
-    _active_indexes: List[int] = PrivateAttr([])
+class PageGroup:
+    def __init__(
+        self: PageGroup,
+        namespace: str,
+        renderer: Renderer,
+    ) -> None:
+        self.namespace: str = namespace
+        self.renderer: Renderer = renderer
+        # Pages are mostly inserted at the front
+        self._page_ids: Deque[str] = deque()
+        # Replaced rather than mutated, so lookups need no lock; writers
+        # copy and publish it under the group lock
+        self._pages: Dict[str, PageManager] = {}
+        self._lock: Lock = Lock()
+        # Activation history, most recent first; grows with every activation
+        self._active_indexes: Deque[int] = deque()
 
     @property
     def num_pages(self: PageGroup) -> int:
         return len(self._page_ids)
 
     def in_group(self: PageGroup, page_id: str) -> bool:
-        return page_id in self._page_ids
+        # The pages dict holds the same ids as the ordered list
+        return page_id in self._pages
 
     def insert_page(
         self: PageGroup,
@@ -30,35 +41,45 @@ class PageGroup(BaseModel):
         uri: str,
         session_data: Dict[str, Any],
         position: int,
-    ) -> None:
-        if page_id not in self._page_ids:
-            if not validate_position(position, self.num_pages):
-                position = fix_position(position, self.num_pages)
-            self._page_ids.insert(position, page_id)
-        else:
-            index = self._page_ids.index(page_id)
-            if index != position:
-                page_id = self._page_ids.pop(index)
-                if not validate_position(position, self.num_pages):
-                    position = fix_position(position, self.num_pages)
-                self._page_ids.insert(position, page_id)
-            logger.info(
-                f"Page '{page_id}' already exists. "
-                "Page manager will be updated."
-            )
-        self._pages[page_id] = PageManager(
+    ) -> PageManager:
+        # Build the page before taking the lock, it may load a module
+        page_manager = PageManager(
             namespace=self.namespace,
             page_id=page_id,
             page_src=uri,
             renderer=self.renderer,
             session_data=session_data,
         )
+        with self._lock:
+            if page_id not in self._pages:
+                if position == 0:
+                    self._page_ids.appendleft(page_id)
+                else:
+                    if not validate_position(position, self.num_pages):
+                        position = fix_position(position, self.num_pages)
+                    self._page_ids.insert(position, page_id)
+            else:
+                index = self._page_ids.index(page_id)
+                if index != position:
+                    del self._page_ids[index]
+                    if not validate_position(position, self.num_pages):
+                        position = fix_position(position, self.num_pages)
+                    self._page_ids.insert(position, page_id)
+                logger.info(
+                    f"Page '{page_id}' already exists. "
+                    "Page manager will be updated."
+                )
+            self._pages = {**self._pages, page_id: page_manager}
+        return page_manager
 
     def get_page_id(self: PageGroup, position: int) -> Optional[str]:
         if not validate_position(position, self.num_pages - 1):
             return None
         return self._page_ids[position]
 
+    def get_page_manager(self: PageGroup, page_id: str) -> Optional[PageManager]:
+        return self._pages.get(page_id, None)
+
     def get_page(self: PageGroup, page_id: str) -> Optional[Any]:
         page_items = self._pages.get(page_id, None)
         if not page_items:
@@ -82,19 +103,29 @@ class PageGroup(BaseModel):
     def remove_page(
         self: PageGroup,
         id: Union[int, str],
-    ) -> None:
-        if isinstance(id, int):
-            page_id = self.get_page_id(id)
-        else:
-            page_id = id
-        if page_id in self._page_ids:
-            self._page_ids.remove(page_id)
-            del self._pages[page_id]
-        else:
-            logger.warning(
-                f"Page '{page_id}' does not exist. "
-                "Nothing to remove."
-            )
+    ) -> Optional[str]:
+        with self._lock:
+            if isinstance(id, int):
+                page_id, position = self.get_page_id(id), id
+            else:
+                page_id, position = id, None
+            if page_id in self._pages:
+                # Pages are indexed by id, so only a removal by id scans
+                # the list
+                if position is None:
+                    position = self._page_ids.index(page_id)
+                del self._page_ids[position]
+                self._pages = {
+                    key: page_manager
+                    for key, page_manager in self._pages.items()
+                    if key != page_id
+                }
+                return page_id
+        logger.warning(
+            f"Page '{page_id}' does not exist. "
+            "Nothing to remove."
+        )
+        return None
 
     def move_page(
         self: PageGroup,
@@ -103,7 +134,7 @@ class PageGroup(BaseModel):
     ) -> None:
         if isinstance(id, str):
             from_position = str(id)
-            invalid_position = from_position not in self._page_ids
+            invalid_position = from_position not in self._pages
             if not invalid_position:
                 id = self._page_ids.index(from_position)
         else:
@@ -120,20 +151,22 @@ class PageGroup(BaseModel):
         if not validate_position(to_position, self.num_pages):
             to_position = fix_position(to_position, self.num_pages)
         # Switch position
-        item = self._page_ids.pop(id)  # type: ignore
-        self._page_ids.insert(to_position, item)
+        with self._lock:
+            item = self._page_ids[id]  # type: ignore
+            del self._page_ids[id]  # type: ignore
+            self._page_ids.insert(to_position, item)
 
     def deactivate_page(self: PageGroup) -> None:
         if not self._active_indexes:
             return None
-        active_index = self._active_indexes.pop(0)
+        active_index = self._active_indexes.popleft()
         self._active_indexes.insert(1, active_index)
 
     def activate_page(self: PageGroup, id: Union[int, str]) -> None:
         if isinstance(id, int) and validate_position(id, self.num_pages - 1):
-            self._active_indexes.insert(0, id)
-        elif isinstance(id, str) and id in self._page_ids:
-            self._active_indexes.insert(0, self._page_ids.index(id))
+            self._active_indexes.appendleft(id)
+        elif isinstance(id, str) and id in self._pages:
+            self._active_indexes.appendleft(self._page_ids.index(id))
         else:
             logger.warning(
                 f"Page '{id}' does not exist. "
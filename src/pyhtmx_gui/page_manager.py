@@ -1,8 +1,8 @@
 from __future__ import annotations
 from typing import Any, Type, Union, Optional, List, Dict, Callable
-from secrets import token_hex
 from functools import partial
 import re
+from string import whitespace
 from .types import (
     InteractionParameter,
     Callback,
@@ -12,13 +12,16 @@ from .types import (
     OutputItem,
     DOMEvent,
 )
-from .kit import Page
+from .kit import Page, ID_COUNTER
 from .utils import build_page
 from .logger import logger
+from .event_sender import format_message_prefix
 from pyhtmx.html_tag import HTMLTag
 
 
 FILTER_REGEX: re.Pattern = re.compile(r'(?:\[)(.*)(?:\])')
+SEPARATOR_REGEX: re.Pattern = re.compile(r'[\s:]+')
+SEPARATORS: str = whitespace + ':'
 
 
 class PageRegistrationInterface:
@@ -30,7 +33,7 @@ class PageRegistrationInterface:
         target_level: Optional[str] = "innerHTML",
     ) -> None:
         # Set new id
-        _id: str = token_hex(4)
+        _id: str = f"{next(ID_COUNTER):08x}"
         parameter_id = f"{parameter}-{_id}"
         attributes: Dict[str, str] = {
             "sse-swap": parameter_id,
@@ -44,12 +47,63 @@ class PageRegistrationInterface:
             parameter_name=parameter,
             parameter_id=parameter_id,
             target=target,
+            wire_prefix=format_message_prefix(parameter_id),
         )
         # Register parameter
-        cls.set_item(
-            item_type=PageItem.PARAMETER,
-            key=parameter,
-            value=interaction_parameter,
+        cls.add_parameter(parameter, interaction_parameter)
+
+    @staticmethod
+    def _set_local_callback_attributes(
+        event: str,
+        event_id: str,
+        _id: str,
+        source: HTMLTag,
+        target: Union[HTMLTag, str],
+        target_level: str,
+    ) -> None:
+        # Add necessary attributes to elements for local action
+        if isinstance(target, HTMLTag) and "id" not in target.attributes:
+            target_id = f"target-{_id}"
+            target.update_attributes(
+                attributes={
+                    "id": target_id,
+                },
+            )
+        source.update_attributes(
+            attributes={
+                "hx-get": f"/local-event/{event_id}",
+                "hx-trigger": event,
+                "hx-target": target.attributes["id"],  # type: ignore
+                "hx-swap": target_level,
+                "hx-vals": "js:{event: stringify_event(event)}",
+            },
+        )
+
+    @staticmethod
+    def _set_global_callback_attributes(
+        event: str,
+        event_id: str,
+        source: HTMLTag,
+        target: Union[HTMLTag, str, None],
+    ) -> None:
+        # Add necessary attributes to elements for global action
+        if target:
+            event_ids = target.attributes.get("sse-swap", '')  # type: ignore
+            event_ids = ",".join(filter(bool, (event_ids, event_id)))  # type: ignore
+            target.update_attributes(  # type: ignore
+                attributes={
+                    "sse-swap": event_ids,
+                },
+            )
+        events = source.attributes.get("hx-trigger", '')
+        events = ", ".join(filter(bool, (events, event)))  # type: ignore
+        source.update_attributes(
+            attributes={
+                # TODO: for multiple events, use hx_vals
+                "hx-post": f"/global-event/{event_id}",
+                "hx-trigger": events,
+                "hx-vals": "js:{event: stringify_event(event)}",
+            },
         )
 
     @staticmethod
@@ -62,59 +116,33 @@ class PageRegistrationInterface:
         target: Union[HTMLTag, str] = "root",
         target_level: str = "innerHTML",
     ) -> None:
+        # Normalize the context so members can be compared by identity
+        if not isinstance(context, CallbackContext):
+            try:
+                context = CallbackContext(context)
+            except ValueError:
+                logger.warning("Unknown context type. Callback not registered.")
+                return
         # Set root container if target was specified as "root"
         if target and target == "root":
             target = cls.renderer._root
         # Set new id
-        _id: str = token_hex(4)
-        _event: str = FILTER_REGEX.sub('', event).replace(":", ' ')
-        event_id: str = '-'.join([*_event.split(), _id])
-        if context == CallbackContext.LOCAL:
-            # Add necessary attributes to elements for local action
-            if isinstance(target, HTMLTag) and "id" not in target.attributes:
-                target_id = f"target-{_id}"
-                target.update_attributes(
-                    attributes={
-                        "id": target_id,
-                    },
-                )
-            source.update_attributes(
-                attributes={
-                    "hx-get": f"/local-event/{event_id}",
-                    "hx-trigger": event,
-                    "hx-target": target.attributes["id"],  # type: ignore
-                    "hx-swap": target_level,
-                    "hx-vals": "js:{event: stringify_event(event)}",
-                },
-            )
-            item_type = PageItem.LOCAL_CALLBACK
-        elif context == CallbackContext.GLOBAL:
-            # Add necessary attributes to elements for global action
-            if target:
-                event_ids = target.attributes.get("sse-swap", '')  # type: ignore
-                event_ids = ",".join(filter(bool, (event_ids, event_id)))  # type: ignore
-                target.update_attributes(  # type: ignore
-                    attributes={
-                        "sse-swap": event_ids,
-                    },
-                )
-            events = source.attributes.get("hx-trigger", '')
-            events = ", ".join(filter(bool, (events, event)))  # type: ignore
-            source.update_attributes(
-                attributes={
-                    # TODO: for multiple events, use hx_vals
-                    "hx-post": f"/global-event/{event_id}",
-                    "hx-trigger": events,
-                    "hx-vals": "js:{event: stringify_event(event)}",
-                },
+        _id: str = f"{next(ID_COUNTER):08x}"
+        _event: str = FILTER_REGEX.sub('', event).strip(SEPARATORS)
+        event_id: str = (
+            f"{SEPARATOR_REGEX.sub('-', _event)}-{_id}" if _event else _id
+        )
+        if context is CallbackContext.LOCAL:
+            PageRegistrationInterface._set_local_callback_attributes(
+                event, event_id, _id, source, target, target_level,
             )
-            item_type = PageItem.GLOBAL_CALLBACK
         else:
-            logger.warning("Unknown context type. Callback not registered.")
-            return
+            PageRegistrationInterface._set_global_callback_attributes(
+                event, event_id, source, target,
+            )
         # Instantiate callback
         callback: Callback = Callback(
-            context=context,  # type: ignore
+            context=context,
             event_name=event,
             event_id=event_id,
             fn=fn,
@@ -123,11 +151,7 @@ class PageRegistrationInterface:
             target_level=target_level,
         )
         # Register callback
-        cls.set_item(
-            item_type=item_type,
-            key=event_id,
-            value=callback,
-        )
+        cls.add_callback(callback)
 
     @staticmethod
     def register_dialog(
@@ -136,11 +160,7 @@ class PageRegistrationInterface:
         dialog_content: HTMLTag,
     ) -> None:
         # Register dialog
-        cls.set_item(
-            item_type=PageItem.DIALOG,
-            key=dialog_id,
-            value=dialog_content,
-        )
+        cls.add_dialog(dialog_id, dialog_content)
 
 
 class PageManager:
@@ -165,8 +185,9 @@ class PageManager:
         self._global_callbacks: Dict[str, Callback] = {}
         self._local_callbacks: Dict[str, Callback] = {}
         self._page: Optional[Union[Page, HTMLTag]] = None
-        self._item_map: Dict[PageItem, Dict[str, OutputItem]] = {}  # type: ignore
-        self.model_post_init()
+        self.build_page()
+        self.set_route()
+        self.post_set_up()
 
     @property
     def page(self: PageManager) -> Any:
@@ -190,12 +211,6 @@ class PageManager:
         else:
             return getattr(self, name)
 
-    def model_post_init(self: PageManager, context: Any = None) -> None:
-        self.set_item_map()
-        self.build_page()
-        self.set_route()
-        self.post_set_up()
-
     def set_route(self: PageManager) -> None:
         if hasattr(self._page, "_route"):
             self.route = self._page.route  # type: ignore
@@ -222,50 +237,82 @@ class PageManager:
         if isinstance(self._page, Page) and hasattr(self._page, "set_up"):
             self._page.set_up(page_manager=self)
 
-    def set_item_map(self: PageManager) -> None:
-        self._item_map[PageItem.DIALOG] = self._dialogs
-        self._item_map[PageItem.PARAMETER] = self._parameters
-        self._item_map[PageItem.LOCAL_CALLBACK] = self._local_callbacks
-        self._item_map[PageItem.GLOBAL_CALLBACK] = self._global_callbacks
-
     def set_item(
         self: PageManager,
         item_type: PageItem,
         key: str,
         value: InputItem,
     ) -> None:
-        item = self._item_map.get(item_type, None)
-        if item is None:
+        if item_type is PageItem.PARAMETER:
+            self.add_parameter(key, value)  # type: ignore
+        elif item_type is PageItem.DIALOG:
+            self.add_dialog(key, value)  # type: ignore
+        elif item_type is PageItem.LOCAL_CALLBACK:
+            self._local_callbacks[key] = value  # type: ignore
+        elif item_type is PageItem.GLOBAL_CALLBACK:
+            self._global_callbacks[key] = value  # type: ignore
+        else:
             logger.warning(
                 f"Unknown page group item: {item_type}. "
                 f"Pair ({key}, {value}) not set."
             )
-            return
-        if item_type == PageItem.PARAMETER:
-            if key not in item:
-                item[key] = []
-            item[key].append(value)  # type: ignore
-        else:
-            item[key] = value
 
     def get_item(
         self: PageManager,
         item_type: PageItem,
         key: str
     ) -> Optional[OutputItem]:
-        item = self._item_map.get(item_type, {})
-        value = item.get(key, None)
-        if not item:
+        item: Optional[Dict[str, Any]]
+        if item_type is PageItem.PARAMETER:
+            item = self._parameters
+        elif item_type is PageItem.DIALOG:
+            item = self._dialogs
+        elif item_type is PageItem.LOCAL_CALLBACK:
+            item = self._local_callbacks
+        elif item_type is PageItem.GLOBAL_CALLBACK:
+            item = self._global_callbacks
+        else:
             logger.warning(
                 f"Unknown page group item: {item_type}."
             )
-        elif not value:
+            return None
+        value = item.get(key, None)
+        if not value:
             logger.warning(
                 f"Key '{key}' for item '{item_type}' not found."
             )
-        else:
-            pass
-        return value  # type: ignore
+        return value
+
+    def add_dialog(
+        self: PageManager,
+        dialog_id: str,
+        dialog_content: HTMLTag,
+    ) -> None:
+        self._dialogs[dialog_id] = dialog_content
+
+    def add_parameter(
+        self: PageManager,
+        parameter: str,
+        interaction_parameter: InteractionParameter,
+    ) -> None:
+        self._parameters.setdefault(parameter, []).append(interaction_parameter)
+
+    def add_callback(self: PageManager, callback: Callback) -> None:
+        callback_mapping: Dict[str, Callback] = (
+            self._local_callbacks
+            if callback.context is CallbackContext.LOCAL
+            else self._global_callbacks
+        )
+        callback_mapping[callback.event_id] = callback
+
+    def get_dialog(self: PageManager, dialog_id: str) -> Optional[HTMLTag]:
+        return self._dialogs.get(dialog_id)
+
+    def get_parameters(
+        self: PageManager,
+        parameter: str,
+    ) -> Optional[List[InteractionParameter]]:
+        return self._parameters.get(parameter)
 
     def update_data(
         self: PageManager,
@@ -293,17 +340,16 @@ class PageManager:
         event_id: str,
         event: Optional[DOMEvent] = None,
     ) -> Any:
-        callback: Optional[Callback] = self.get_item(
-            item_type=(
-                PageItem.LOCAL_CALLBACK if context == CallbackContext.LOCAL
-                else PageItem.GLOBAL_CALLBACK
-            ),
-            key=event_id,
+        callback_mapping: Dict[str, Callback] = (
+            self._local_callbacks if context is CallbackContext.LOCAL
+            else self._global_callbacks
         )
+        callback: Optional[Callback] = callback_mapping.get(event_id)
         content: Any = None
         if callback:
-            # Call
+            # Call (callbacks may change the page, so drop its rendering)
             content = callback.fn(event)
+            self.renderer.invalidate_render_cache(self.namespace, self.page_id)
         else:
             logger.warning(f"Callback for event '{event_id}' not found.")
         return content
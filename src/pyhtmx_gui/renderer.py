@@ -1,29 +1,51 @@
 from __future__ import annotations
 from typing import Optional, List, Tuple, Set, Dict, Any
-from copy import deepcopy
 from threading import Lock
 from queue import Queue
 from pyhtmx import Html, Div, Dialog  # type: ignore
+from pyhtmx.html_tag import HTMLTag
 from .logger import logger
-from .master import MASTER_DOCUMENT
-from .types import InteractionParameter, PageItem, PageNeighbor, EventType
+from .master import build_master_document
+from .types import InteractionParameter, PageNeighbor, EventType
 from .kit import Page
 from .status_bar import StatusBar
 from .page_manager import PageManager
-from .event_sender import EventSender, global_sender
+from .event_sender import (
+    EventSender,
+    global_sender,
+    format_message,
+    ROOT_PREFIX,
+    DIALOG_PREFIX,
+)
+from .utils import clone_tag
 
 
 SPECIAL_NAMESPACES: Set[str] = {"status"}
 
 
 class Renderer:
+    __slots__ = (
+        "_clients",
+        "_gui_manager",
+        "_last_shown",
+        "_queue",
+        "_lock",
+        "_root",
+        "_dialog_root",
+        "_special_managers",
+        "_render_cache",
+        "_closed_dialog",
+        "_status",
+        "_master",
+    )
     event_sender: EventSender = global_sender
 
     def __init__(self: Renderer):
-        self._clients = []
+        self._clients: Set[str] = set()
         self._gui_manager: Optional[Any] = None  # type: Optional[GUIManager]
         self._last_shown: Tuple[str, str] = tuple()  # type: ignore
         self._queue: Queue = Queue()
+        # Guards changes to the live document against concurrent cloning
         self._lock: Lock = Lock()
         self._root: Div = Div(
             _id="root",
@@ -38,6 +60,11 @@ class Renderer:
             hx_swap="outerHTML",
         )
         self._special_managers: Dict[Tuple[str, str], PageManager] = {}
+        # Serialized tags per route, keyed by "root" or dialog id
+        self._render_cache: Dict[
+            Tuple[str, str], Dict[str, Tuple[HTMLTag, str]]
+        ] = {}
+        self._closed_dialog: Optional[str] = None
         status_ns, status_id = ("status", "status-bar")
         status_manager = PageManager(
             namespace=status_ns,
@@ -46,8 +73,8 @@ class Renderer:
             renderer=self,
         )
         self._status: Page = status_manager.page
-        self._master: Html = MASTER_DOCUMENT
-        body, = self._master.find_elements_by_tag(tag="body")
+        self._master: Html
+        self._master, body = build_master_document()
         body.add_child(self._status.widget)
         body.add_child(self._root)
         body.add_child(self._dialog_root)
@@ -57,6 +84,14 @@ class Renderer:
     def document(self: Renderer) -> Html:
         return self._master
 
+    @property
+    def has_clients(self: Renderer) -> bool:
+        return bool(self._clients)
+
+    def clone_document(self: Renderer) -> Html:
+        with self._lock:
+            return clone_tag(self._master)  # type: ignore
+
     def is_special(self: Renderer, namespace: str) -> bool:
         return namespace in SPECIAL_NAMESPACES
 
@@ -74,23 +109,73 @@ class Renderer:
         namespace: str,
         page_id: str,
     ) -> Optional[PageManager]:
-        route: Tuple[str, str] = (namespace, page_id)
-        if route in self._special_managers:
-            return self._special_managers[route]
-        return None
+        return self._special_managers.get((namespace, page_id))
+
+    def _cached_render(
+        self: Renderer,
+        route: Tuple[str, str],
+        key: str,
+        tag: HTMLTag,
+    ) -> Tuple[Optional[str], Dict[str, Tuple[HTMLTag, str]]]:
+        # Must be called with the lock held
+        route_cache = self._render_cache.setdefault(route, {})
+        cached = route_cache.get(key)
+        if cached is not None and cached[0] is tag:
+            return cached[1], route_cache
+        return None, route_cache
+
+    def _publish_render(
+        self: Renderer,
+        route: Tuple[str, str],
+        route_cache: Dict[str, Tuple[HTMLTag, str]],
+        key: str,
+        tag: HTMLTag,
+        rendered: str,
+    ) -> None:
+        with self._lock:
+            # Skip it if the route was invalidated while serializing
+            if self._render_cache.get(route) is route_cache:
+                route_cache[key] = (tag, rendered)
+
+    def render(
+        self: Renderer,
+        route: Tuple[str, str],
+        key: str,
+        tag: HTMLTag,
+    ) -> str:
+        # Reuse the serialization while the route was not modified;
+        # otherwise serialize a snapshot outside the lock
+        with self._lock:
+            rendered, route_cache = self._cached_render(route, key, tag)
+            if rendered is not None:
+                return rendered
+            snapshot = clone_tag(tag)
+        rendered = snapshot.to_string()
+        self._publish_render(route, route_cache, key, tag, rendered)
+        return rendered
+
+    def invalidate_render_cache(
+        self: Renderer,
+        namespace: Optional[str],
+        page_id: Optional[str] = None,
+    ) -> None:
+        # Without a page id, drop every route of the namespace
+        if page_id is not None:
+            self._render_cache.pop((namespace, page_id), None)  # type: ignore
+            return
+        for route in [r for r in self._render_cache if r[0] == namespace]:
+            self._render_cache.pop(route, None)
 
     def set_gui_manager(self: Renderer, gui_manager: Any) -> None:
         self._gui_manager = gui_manager
 
     def register_client(self: Renderer, client_id: str) -> None:
-        if client_id not in self._clients:
-            self._clients.append(client_id)
-        logger.info(f"Number of clients in registry: {len(self._clients)}")
+        self._clients.add(client_id)
+        logger.info("Number of clients in registry: %d", len(self._clients))
 
     def deregister(self: Renderer, client_id: str) -> None:
-        if client_id in self._clients:
-            self._clients.remove(client_id)
-        logger.info(f"Number of clients in registry: {len(self._clients)}")
+        self._clients.discard(client_id)
+        logger.info("Number of clients in registry: %d", len(self._clients))
 
     def update_special_attributes(
         self: Renderer,
@@ -105,42 +190,73 @@ class Renderer:
         )
         if not page_manager:
             logger.info(
-                f"Page '{page_id}' not available for namespace '{namespace}'. "
-                "Parameter will not be updated."
+                "Page '%s' not available for namespace '%s'. "
+                "Parameter will not be updated.",
+                page_id,
+                namespace,
             )
             return
 
         parameter_list: Optional[List[InteractionParameter]] = \
-            page_manager.get_item(
-                item_type=PageItem.PARAMETER,
-                key=parameter,
-            )
+            page_manager.get_parameters(parameter)
         if not parameter_list:
             logger.warning(
-                f"Parameter '{namespace}::{page_id}::{parameter}' "
-                "not registered."
+                "Parameter '%s::%s::%s' not registered.",
+                namespace,
+                page_id,
+                parameter,
             )
             return
 
-        for interaction_parameter in parameter_list:
-            parameter_id = interaction_parameter.parameter_id
-            component = interaction_parameter.target
-            attributes = dict(attribute)
-            text_content = attributes.pop("inner_content", None)
-            component.update_attributes(
-                text_content=text_content,
-                attributes=attributes,
-            )
-            if attributes:
-                self.send(
-                    component.to_string(),
-                    event_id=parameter_id,
-                )
-            else:
-                self.send(
-                    text_content,
-                    event_id=parameter_id,
+        # The same update applies to every target of the parameter
+        attributes = dict(attribute)
+        text_content = attributes.pop("inner_content", None)
+        self._update_targets(
+            parameter_list,
+            text_content,
+            attributes,
+            notify=self.has_clients,
+            send_component=bool(attributes),
+        )
+
+    def _update_targets(
+        self: Renderer,
+        parameter_list: List[InteractionParameter],
+        text_content: Optional[str],
+        attributes: Dict[str, Any],
+        notify: bool,
+        send_component: bool,
+        route: Optional[Tuple[str, str]] = None,
+    ) -> None:
+        msgs: List[Tuple[bytes, bytes]] = []
+        # Serialize each component once, even if bound more than once
+        rendered: Dict[int, str] = {}
+        with self._lock:
+            for interaction_parameter in parameter_list:
+                component = interaction_parameter.target
+                component.update_attributes(
+                    text_content=text_content,
+                    attributes=attributes,
                 )
+                if not notify:
+                    continue
+                if send_component:
+                    data = rendered.get(id(component))
+                    if data is None:
+                        data = component.to_string()
+                        rendered[id(component)] = data
+                elif text_content is None:
+                    continue
+                else:
+                    data = text_content
+                prefix = interaction_parameter.wire_prefix
+                msgs.append((prefix, format_message(prefix, data)))
+            # Drop the page rendering only once the targets changed, so a
+            # concurrent render cannot cache the previous markup again
+            if route is not None:
+                self._render_cache.pop(route, None)
+        # Push the whole burst at once
+        self.event_sender.send_many(msgs)
 
     def update_attributes(
         self: Renderer,
@@ -162,68 +278,71 @@ class Renderer:
             )
             return
 
-        if not self._gui_manager.in_catalog(namespace):  # type: ignore
-            logger.info(
-                f"Namespace {namespace} not available in the catalog. "
-                "Parameter will not be updated."
-            )
-            return
-
         # If page was not provided, use active page
-        active_page_id = self._gui_manager.get_active_page_id()  # type: ignore
-        page_id = page_id or active_page_id
-        if not self._gui_manager.in_page_group(namespace, page_id):  # type: ignore
+        page_id = page_id or self._gui_manager.get_active_page_id()  # type: ignore
+        # A single lookup also covers namespaces missing from the catalog
+        page_manager: Optional[PageManager] = \
+            self._gui_manager.get_page_manager(  # type: ignore
+                namespace,
+                page_id,
+            )
+        if not page_manager:
             logger.info(
-                f"Page '{page_id}' not available for namespace '{namespace}'. "
-                "Parameter will not be updated."
+                "Page '%s' not available for namespace '%s'. "
+                "Parameter will not be updated.",
+                page_id,
+                namespace,
             )
             return
 
         parameter_list: Optional[List[InteractionParameter]] = \
-            self._gui_manager.get_item(  # type: ignore
-                namespace=namespace,
-                page_id=page_id,
-                item_type=PageItem.PARAMETER,
-                key=parameter,
-            )
+            page_manager.get_parameters(parameter)
         if not parameter_list:
             logger.warning(
-                f"Parameter '{namespace}::{page_id}::{parameter}' "
-                "not registered."
+                "Parameter '%s::%s::%s' not registered.",
+                namespace,
+                page_id,
+                parameter,
             )
             return
 
         route: Tuple[str, str] = (namespace, page_id)  # type: ignore
-        for interaction_parameter in parameter_list:
-            parameter_id = interaction_parameter.parameter_id
-            component = interaction_parameter.target
-            attributes = dict(attribute)
-            text_content = attributes.pop("inner_content", None)
-            component.update_attributes(
-                text_content=text_content,
-                attributes=attributes,
-            )
-            if route == self._last_shown:
-                if attribute:
-                    self.send(
-                        component.to_string(),
-                        event_id=parameter_id,
-                    )
-                else:
-                    self.send(
-                        text_content,
-                        event_id=parameter_id,
-                    )
+        # The same update applies to every target of the parameter
+        attributes = dict(attribute)
+        text_content = attributes.pop("inner_content", None)
+        self._update_targets(
+            parameter_list,
+            text_content,
+            attributes,
+            # Serialize only for clients showing this page
+            notify=self.has_clients and route == self._last_shown,
+            send_component=bool(attributes),
+            route=route,
+        )
 
     def close_dialog(
         self: Renderer,
         dialog_id: Optional[str] = None,
     ) -> None:
         # Remove dialog content and show
-        self._dialog_root.text = None
-        _ = self._dialog_root.detach_children()
-        dialog = deepcopy(self._dialog_root)
-        self.send(dialog.to_string(), event_id="dialog")
+        snapshot: Optional[HTMLTag] = None
+        with self._lock:
+            self._dialog_root.text = None
+            _ = self._dialog_root.detach_children()
+            if self._closed_dialog is None:
+                snapshot = clone_tag(self._dialog_root)
+        if snapshot is not None:
+            self._closed_dialog = self._serialize_dialog(snapshot)
+        self.send_prefixed(DIALOG_PREFIX, self._closed_dialog)
+
+    @staticmethod
+    def _serialize_dialog(dialog_root: HTMLTag, open: bool = False) -> str:
+        dialog: str = dialog_root.to_string()
+        if open:
+            # Attributes of the dialog root are fixed and contain no '>'
+            head, sep, tail = dialog.partition('>')
+            dialog = f'{head} open=""{sep}{tail}'
+        return dialog
 
     def open_dialog(
         self: Renderer,
@@ -243,20 +362,42 @@ class Renderer:
             )
             return
         # Retrieve dialog content
-        dialog_content = self._gui_manager.get_item(  # type: ignore
-            namespace=namespace,
-            page_id=page_id,
-            item_type=PageItem.DIALOG,
-            key=dialog_id,
+        page_manager: Optional[PageManager] = \
+            self._gui_manager.get_page_manager(  # type: ignore
+                namespace,
+                page_id,
+            )
+        dialog_content: Optional[HTMLTag] = (
+            page_manager.get_dialog(dialog_id) if page_manager else None
         )
+        if dialog_content is None:
+            logger.warning(
+                "Dialog '%s::%s::%s' not registered.",
+                namespace,
+                page_id,
+                dialog_id,
+            )
+            return
         # Update dialog root and show
-        self._dialog_root.text = None
-        _ = self._dialog_root.detach_children()
-        self._dialog_root.add_child(dialog_content)
-        dialog = deepcopy(self._dialog_root)
-        dialog.update_attributes(attributes={"open": ''})
-        if (namespace, page_id) == self._last_shown:
-            self.send(dialog.to_string(), event_id="dialog")
+        route: Tuple[str, str] = (namespace, page_id)
+        with self._lock:
+            self._dialog_root.text = None
+            _ = self._dialog_root.detach_children()
+            self._dialog_root.add_child(dialog_content)
+            if route != self._last_shown or not self.has_clients:
+                return
+            data, route_cache = self._cached_render(
+                route, dialog_id, dialog_content,
+            )
+            snapshot = (
+                clone_tag(self._dialog_root) if data is None else None
+            )
+        if snapshot is not None:
+            data = self._serialize_dialog(snapshot, open=True)
+            self._publish_render(
+                route, route_cache, dialog_id, dialog_content, data,
+            )
+        self.send_prefixed(DIALOG_PREFIX, data)
 
     def show(
         self: Renderer,
@@ -268,8 +409,9 @@ class Renderer:
         namespace = namespace or active_namespace
         if not self._gui_manager.in_catalog(namespace):  # type: ignore
             logger.info(
-                f"Namespace {namespace} not available in the catalog. "
-                "Nothing to display."
+                "Namespace %s not available in the catalog. "
+                "Nothing to display.",
+                namespace,
             )
             return
         if namespace != active_namespace:
@@ -280,8 +422,10 @@ class Renderer:
         page_id = page_id or active_page_id
         if not self._gui_manager.in_page_group(namespace, page_id):  # type: ignore
             logger.info(
-                f"Page '{page_id}' not available for namespace '{namespace}'. "
-                "Nothing to display."
+                "Page '%s' not available for namespace '%s'. "
+                "Nothing to display.",
+                page_id,
+                namespace,
             )
             return
         if page_id != active_page_id:
@@ -290,8 +434,9 @@ class Renderer:
         # Queue for displaying
         self._queue.put((namespace, page_id))
         logger.info(
-            f"Page activated: {namespace}::{page_id}. "
-            "Queueing to display."
+            "Page activated: %s::%s. Queueing to display.",
+            namespace,
+            page_id,
         )
         self.update_root()
 
@@ -313,22 +458,22 @@ class Renderer:
         namespace = self._gui_manager.get_active_namespace()  # type: ignore
         if not namespace:
             logger.info(
-                f"No namespace active. "
-                f"{neighbor.title()} page will not be shown."
+                "No namespace active. %s page will not be shown.",
+                neighbor.title(),
             )
             return
         page_index = self._gui_manager.get_active_page_index()  # type: ignore
         if page_index is None:
             logger.info(
-                "No page active. "
-                f"{neighbor.title()} page will not be shown."
+                "No page active. %s page will not be shown.",
+                neighbor.title(),
             )
             return
         num_pages = self._gui_manager.get_num_pages()  # type: ignore
         if num_pages == 1:
             logger.info(
-                "Only one page available. "
-                f"{neighbor.title()} page will not be shown."
+                "Only one page available. %s page will not be shown.",
+                neighbor.title(),
             )
             return
         # Get neighboring page index
@@ -341,14 +486,17 @@ class Renderer:
         # Confirm deactivation of previous page
         if n_page_id != page_id:
             logger.info(
-                f"Page deactivated: {namespace}::{page_id}"
+                "Page deactivated: %s::%s",
+                namespace,
+                page_id,
             )
             page_id = n_page_id
         # Queue for displaying
         self._queue.put((namespace, page_id))
         logger.info(
-            f"Page activated: {namespace}::{page_id}. "
-            "Queueing to display."
+            "Page activated: %s::%s. Queueing to display.",
+            namespace,
+            page_id,
         )
         self.update_neighbor(neighbor)
 
@@ -371,26 +519,32 @@ class Renderer:
                 active_namespace = self._gui_manager.get_active_namespace()  # type: ignore
         else:
             logger.info(
-                f"Namespace {namespace} not available in the catalog."
+                "Namespace %s not available in the catalog.",
+                namespace,
             )
 
         if self._gui_manager.in_page_group(namespace, page_id):  # type: ignore
             # Report only if page is currently active
             if page_id == active_page_id:
                 logger.info(
-                    f"Page deactivated: {namespace}::{page_id}"
+                    "Page deactivated: %s::%s",
+                    namespace,
+                    page_id,
                 )
             # New page to display (for new namespace)
             active_page_id = self._gui_manager.get_active_page_id()  # type: ignore
         else:
             logger.info(
-                f"Page '{page_id}' not available for namespace '{namespace}'."
+                "Page '%s' not available for namespace '%s'.",
+                page_id,
+                namespace,
             )
 
         # Queue for displaying
         logger.info(
-            f"Page activated: {active_namespace}::{active_page_id}. "
-            "Queueing to display."
+            "Page activated: %s::%s. Queueing to display.",
+            active_namespace,
+            active_page_id,
         )
         self._queue.put((active_namespace, active_page_id))
         self.update_root()
@@ -408,27 +562,33 @@ class Renderer:
 
         if not self._gui_manager.in_catalog(namespace):  # type: ignore
             logger.info(
-                f"Namespace {namespace} not available in the catalog."
+                "Namespace %s not available in the catalog.",
+                namespace,
             )
 
         if self._gui_manager.in_page_group(namespace, page_id):  # type: ignore
             # Deactivate only if page is currenly active
             if page_id == active_page_id:
                 logger.info(
-                    f"Page deactivated: {namespace}::{page_id}"
+                    "Page deactivated: %s::%s",
+                    namespace,
+                    page_id,
                 )
                 self._gui_manager.deactivate_page(namespace)  # type: ignore
                 # New page to display
                 active_page_id = self._gui_manager.get_active_page_id()  # type: ignore
         else:
             logger.info(
-                f"Page '{page_id}' not available for namespace '{namespace}'."
+                "Page '%s' not available for namespace '%s'.",
+                page_id,
+                namespace,
             )
 
         # Queue for displaying
         logger.info(
-            f"Page activated: {active_namespace}::{active_page_id}. "
-            "Queueing to display."
+            "Page activated: %s::%s. Queueing to display.",
+            active_namespace,
+            active_page_id,
         )
         self._queue.put((active_namespace, active_page_id))
         self.update_root()
@@ -439,76 +599,90 @@ class Renderer:
         data: Optional[Dict[str, Any]],
     ) -> None:
         logger.info(
-            f"Queueing event: {ovos_event}, data: {data}"
+            "Queueing event: %s, data: %s",
+            ovos_event,
+            data,
         )
         if data:
-            data.update({"ovos_event": ovos_event})
+            # Merge into a new mapping: callers may reuse their data dict
             self._status.update_session_data(
-                session_data=data,
+                session_data={**data, "ovos_event": ovos_event},
                 renderer=self,
             )
-        self._status.update_trigger_state(
-            ovos_event=ovos_event,
-            renderer=self,
-        )
+        # The status bar keeps its triggers on itself, so events it does
+        # not act on need no widget walk
+        if self._status.acts_on(ovos_event):
+            self._status.update_trigger_state(
+                ovos_event=ovos_event,
+                renderer=self,
+            )
+
+    def _mount_root(self: Renderer, page_tag: HTMLTag) -> None:
+        # Keep the live tree in sync, skipping the swap when already mounted
+        children = self._root.children
+        if children and children[0] is page_tag:
+            return
+        self._root.text = None
+        _ = self._root.detach_children()
+        self._root.add_child(page_tag)
 
     def update_root(self: Renderer) -> None:
         namespace, page_id = route = self._queue.get()
         if route == self._last_shown:
             logger.warning(
-                f"Display already showing '{namespace}::{page_id}'. "
-                "Update not required."
+                "Display already showing '%s::%s'. Update not required.",
+                namespace,
+                page_id,
             )
             return
         # Update
         self._last_shown = route
         page_tag = self._gui_manager.get_active_page_tag(namespace)  # type: ignore
-        self._root.text = None
-        _ = self._root.detach_children()
-        self._root.add_child(page_tag)
-        self.send(page_tag.to_string(), event_id="root")
+        with self._lock:
+            self._mount_root(page_tag)
+        if not self.has_clients:
+            return
+        self.send_prefixed(ROOT_PREFIX, self.render(route, "root", page_tag))
 
     def update_neighbor(self: Renderer, neighbor: PageNeighbor) -> None:
         namespace, page_id = route = self._queue.get()
         if route == self._last_shown:
             logger.warning(
-                f"Display already showing '{namespace}::{page_id}'. "
-                "Update not required."
+                "Display already showing '%s::%s'. Update not required.",
+                namespace,
+                page_id,
             )
             return
         # Update
         self._last_shown = route
         page_tag = self._gui_manager.get_active_page_tag(namespace)  # type: ignore
-        self._root.text = None
-        _ = self._root.detach_children()
-        self._root.add_child(page_tag)
+        with self._lock:
+            self._mount_root(page_tag)
+            if not self.has_clients:
+                return
+            page_copy = clone_tag(page_tag)
         # Set animation
         animation: str = (
             "swipe-in-from-right"
             if neighbor == PageNeighbor.NEXT else
             "swipe-in-from-left"
         )
-        page_copy = deepcopy(page_tag)
         page_copy.update_attributes(
             attributes={"class": animation},
             incremental=True,
         )
-        self.send(page_copy.to_string(), event_id="root")
+        self.send_prefixed(ROOT_PREFIX, page_copy.to_string())
 
-    def send(
+    def send_prefixed(
         self: Renderer,
+        prefix: bytes,
         data: Optional[str],
-        event_id: Optional[str] = None,
     ) -> None:
         # Don't send message without clients or data
         if not self._clients or data is None:
             return
-        # Format SSE message
-        data = data.replace('\n', '')
-        msg: str = f"data: {data}\n\n"
-        if event_id is not None:
-            msg = f"event: {event_id}\n{msg}"
-        self.event_sender.send(msg)
+        # Format SSE message (encoded once, shared by all listeners)
+        self.event_sender.send(prefix, format_message(prefix, data))
 
     def send_event_to_ovos(
         self: Renderer,
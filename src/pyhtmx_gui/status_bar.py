@@ -1,6 +1,6 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
-from functools import partial
+from typing import Any, Dict, List, Optional, Tuple, NamedTuple
+from functools import lru_cache
 from pyhtmx.html_tag import HTMLTag
 from pyhtmx import Div  # type: ignore
 from pyhtmx_gui.kit import Page, SessionItem, Trigger
@@ -62,9 +62,90 @@ SPINNER: HTMLTag = HTMLTag(
 )
 
 
+class TextStyle(NamedTuple):
+    classes: Tuple[str, ...]
+    font_name: str
+    font_size: int
+    guard: str
+
+
+# Fixed classes and font metrics of each status text
+TEXT_STYLES: Dict[str, TextStyle] = {
+    "speech": TextStyle(
+        classes=("text-[32px]", "text-white", "font-normal", "border-0"),
+        font_name="VT323-Regular.ttf",
+        font_size=32,
+        guard='',
+    ),
+    "utterance": TextStyle(
+        classes=("text-[24px]", "text-white", "font-medium", "border-0"),
+        font_name="Inter-Regular.woff2",
+        font_size=24,
+        guard=' ',
+    ),
+}
+NO_TEXT_CLASSES: Tuple[str, ...] = ("no-text", "w-[0px]", "border-r-0")
+
+# Spinner animation class set by each OVOS event
+SPINNER_CLASSES: Dict[str, str] = {
+    EventType.WAKEWORD: "visible",  # Activate fade-in
+    EventType.SKILL_HANDLER_START: "visible",
+    EventType.UTTERANCE_HANDLED: "success",  # Activate success
+    EventType.UTTERANCE_CANCELLED: "cancelled",
+    EventType.UTTERANCE_UNDETECTED: "failure",  # Activate failure
+    EventType.INTENT_FAILURE: "failure",
+    EventType.UTTERANCE_END: "fade-out",  # Activate fade-out
+}
+
+
+@lru_cache(maxsize=512)
+def get_text_class(
+    key: str,
+    text: str,
+    duration: Optional[float],
+) -> str:
+    # Depends only on its arguments, so repeated texts skip the font metrics
+    # and get back the same joined class string
+    style = TEXT_STYLES[key]
+    if not text:
+        return " ".join((*style.classes, *NO_TEXT_CLASSES))
+    length: int = len(text)
+    text += style.guard
+    if duration is None:
+        duration = calculate_duration(text)
+    width = calculate_text_width(
+        text,
+        font_name=style.font_name,
+        font_size=style.font_size,
+    ) + 8
+    return " ".join(
+        (
+            *style.classes,
+            f"{key}-props-{duration:0.2f}-{length:d}",
+            f"w-[{width}px]",
+            "border-r-8",
+        )
+    )
+
+
 class StatusBar(Page):
     _parameters = ("ovos_event", "utterance", "speech")
     _is_page = False
+    _spinner_events: Tuple[EventType, ...] = (
+        EventType.WAKEWORD,
+        # EventType.RECORD_BEGIN,
+        # EventType.RECORD_END,
+        # EventType.UTTERANCE,
+        EventType.SKILL_HANDLER_START,
+        # EventType.SKILL_HANDLER_COMPLETE,
+        EventType.UTTERANCE_HANDLED,
+        EventType.UTTERANCE_CANCELLED,
+        EventType.UTTERANCE_UNDETECTED,
+        EventType.INTENT_FAILURE,
+        EventType.UTTERANCE_END,
+        # EventType.AUDIO_OUTPUT_START,
+        # EventType.AUDIO_OUTPUT_END,
+    )
 
     def __init__(
         self: StatusBar,
@@ -85,10 +166,7 @@ class StatusBar(Page):
                 attribute=("inner_content", "class"),
                 component=self._speech,
                 format_value={
-                    "inner_content": partial(
-                        self.get_speech_or_utterance,
-                        key="speech",
-                    ),
+                    "inner_content": self.get_speech_or_utterance,
                     "class": self.get_speech_class,
                 },
                 target_level="outerHTML",
@@ -105,10 +183,7 @@ class StatusBar(Page):
                 attribute=("inner_content", "class"),
                 component=self._utterance,
                 format_value={
-                    "inner_content": partial(
-                        self.get_speech_or_utterance,
-                        key="utterance",
-                    ),
+                    "inner_content": self.get_speech_or_utterance,
                     "class": self.get_utterance_class,
                 },
                 target_level="outerHTML",
@@ -128,21 +203,7 @@ class StatusBar(Page):
             },
             target_level="attribute:class",
         )
-        for ovos_event in [
-            EventType.WAKEWORD,
-            # EventType.RECORD_BEGIN,
-            # EventType.RECORD_END,
-            # EventType.UTTERANCE,
-            EventType.SKILL_HANDLER_START,
-            # EventType.SKILL_HANDLER_COMPLETE,
-            EventType.UTTERANCE_HANDLED,
-            EventType.UTTERANCE_CANCELLED,
-            EventType.UTTERANCE_UNDETECTED,
-            EventType.INTENT_FAILURE,
-            EventType.UTTERANCE_END,
-            # EventType.AUDIO_OUTPUT_START,
-            # EventType.AUDIO_OUTPUT_END,
-        ]:
+        for ovos_event in self._spinner_events:
             self.add_interaction(
                 ovos_event.value,
                 spinner_trigger,
@@ -179,96 +240,26 @@ class StatusBar(Page):
             },
         )
 
-    def get_speech_or_utterance(
-        self: StatusBar,
-        value: Any = None,
-        key: str = "utterance",
-    ) -> str:
-        text: str = self._session_data.get(key, StatusUtterance()).text
+    @staticmethod
+    def get_speech_or_utterance(value: Any = None) -> str:
+        # Formatters get the value just stored in the session data
+        text: str = (value or StatusUtterance()).text
         return text or ""
 
     def get_speech_class(
         self: StatusBar,
         value: Any = None,
-    ) -> list[str]:
-        font_size: int = 32
-        guard: str = ''
-        _class: list[str] = [
-            f"text-[{font_size}px]",
-            "text-white",
-            "font-normal",
-            "border-0",
-        ]
+    ) -> str:
         value = value or StatusUtterance()
-        text: str = value.text
-        duration: Optional[float] = value.duration
-        if text:
-            length: int = len(text)
-            text += guard
-            if duration is None:
-                duration = calculate_duration(text)
-            width = calculate_text_width(
-                text or "",
-                font_name="VT323-Regular.ttf",
-                font_size=font_size,
-            ) + 8
-            _class.extend(
-                [
-                    f"speech-props-{duration:0.2f}-{length:d}",
-                    f"w-[{width}px]",
-                    "border-r-8",
-                ]
-            )
-        else:
-            _class.extend(["no-text", "w-[0px]", "border-r-0"])
-        return _class
+        return get_text_class("speech", value.text, value.duration)
 
     def get_utterance_class(
         self: StatusBar,
         value: Any = None,
-    ) -> list[str]:
-        font_size: int = 24
-        guard: str = ' '
-        _class: list[str] = [
-            f"text-[{font_size}px]",
-            "text-white",
-            "font-medium",
-            "border-0",
-        ]
+    ) -> str:
         value = value or StatusUtterance()
-        text: str = value.text
-        duration: Optional[float] = value.duration
-        if text:
-            length: int = len(text)
-            text += guard
-            if duration is None:
-                duration = calculate_duration(text)
-            width = calculate_text_width(
-                text or "",
-                font_name="Inter-Regular.woff2",
-                font_size=font_size,
-            ) + 8
-            _class.extend(
-                [
-                    f"utterance-props-{duration:0.2f}-{length:d}",
-                    f"w-[{width}px]",
-                    "border-r-8",
-                ]
-            )
-        else:
-            _class.extend(["no-text", "w-[0px]", "border-r-0"])
-        return _class
+        return get_text_class("utterance", value.text, value.duration)
 
-    def get_spinner_class(self: StatusBar, ovos_event: str) -> Optional[str]:
-        if ovos_event in (EventType.WAKEWORD, EventType.SKILL_HANDLER_START):
-            return "visible"  # Activate fade-in
-        elif ovos_event in (EventType.UTTERANCE_HANDLED, ):
-            return "success"  # Activate success
-        elif ovos_event in (EventType.UTTERANCE_CANCELLED, ):
-            return "cancelled"
-        elif ovos_event in (EventType.UTTERANCE_UNDETECTED, EventType.INTENT_FAILURE):
-            return "failure"  # Activate failure
-        elif ovos_event in (EventType.UTTERANCE_END, ):
-            return "fade-out"  # Activate fade-out
-        else:
-            return None
+    @staticmethod
+    def get_spinner_class(ovos_event: str) -> Optional[str]:
+        return SPINNER_CLASSES.get(ovos_event)
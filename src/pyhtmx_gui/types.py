@@ -1,4 +1,6 @@
-from typing import Any, List, Dict, Union, Optional, Callable, TypeVar
+from typing import (
+    Any, List, Dict, Union, Optional, Callable, TypeVar, NamedTuple
+)
 from enum import Enum
 import json
 from types import SimpleNamespace as Namespace
@@ -86,11 +88,9 @@ class PageNeighbor(str, Enum):
     PREVIOUS = "previous"
 
 
-class Callback(BaseModel):
-    model_config = ConfigDict(
-        strict=False,
-        arbitrary_types_allowed=True,
-    )
+# NOTE: registration records are built once per registration and only read
+# afterwards, so they are plain named tuples rather than validated models.
+class Callback(NamedTuple):
     context: CallbackContext
     event_name: str
     event_id: str
@@ -100,14 +100,12 @@ class Callback(BaseModel):
     target_level: str = "innerHTML"
 
 
-class InteractionParameter(BaseModel):
-    model_config = ConfigDict(
-        strict=False,
-        arbitrary_types_allowed=True,
-    )
+class InteractionParameter(NamedTuple):
     parameter_name: str
     parameter_id: str
     target: HTMLTag
+    # SSE header for the parameter's updates, built once at registration
+    wire_prefix: bytes
 
 
 class StatusUtterance(BaseModel):
@@ -9,7 +9,7 @@ from .kit import Page
 from .logger import logger
 from pyhtmx.html_tag import HTMLTag
 from math import exp, log
-from functools import partial
+from functools import partial, lru_cache
 
 
 MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -90,16 +90,57 @@ def fix_position(position: int, ub: int) -> int:
     return max(min(position, ub), 0)
 
 
+def clone_tag(tag: HTMLTag, parent: Optional[HTMLTag] = None) -> HTMLTag:
+    # Copy only what a tag needs to be rendered and updated. Unlike
+    # deepcopy, this does not follow the parent reference up the tree
+    # nor walk every object reachable from the tag. It relies on pyhtmx
+    # internals (_element, _parent, _children), hence the pinned version.
+    clone = object.__new__(type(tag))
+    clone.__dict__.update(tag.__dict__)
+    clone.attributes = {
+        key: value.copy() if isinstance(value, (list, dict)) else value
+        for key, value in tag.attributes.items()
+    }
+    element = tag._element
+    clone._element = element.makeelement(element.tag, dict(element.attrib))
+    clone._element.text = element.text
+    clone._element.tail = element.tail
+    clone._parent = parent
+    if parent is not None:
+        parent._element.append(clone._element)
+    clone._children = [clone_tag(child, clone) for child in tag.children]
+    return clone
+
+
+def _duration(length: int) -> float:
+    return 2.0 * (1.0 - exp(log(0.75) * length / 10))
+
+
+# Durations depend only on the text length; precompute common lengths
+DURATIONS: Tuple[float, ...] = tuple(map(_duration, range(1024)))
+
+
 def calculate_duration(text: str) -> float:
-    return 2.0 * (1.0 - exp(log(0.75) * len(text) / 10))
+    length = len(text)
+    if length < len(DURATIONS):
+        return DURATIONS[length]
+    return _duration(length)
+
+
+@lru_cache(maxsize=None)
+def load_font(font_name: str, font_size: int) -> ImageFont.FreeTypeFont:
+    # Only a couple of fonts are used, so keep them parsed
+    return ImageFont.truetype(os.path.join(ASSETS_DIR, font_name), font_size)
 
 
+# Utterances repeat, and measuring them loads and shapes the font
+@lru_cache(maxsize=2048)
 def calculate_text_width(
     text: str,
     font_name: str = "helvetica",
     font_size: int = 24
 ) -> int:
-    font = ImageFont.truetype(os.path.join(ASSETS_DIR, font_name), font_size)
+    font = load_font(font_name, font_size)
     size = font.getlength(text)
     return round(size + 0.5)
 
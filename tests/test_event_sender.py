@@ -0,0 +1,59 @@
+from typing import List
+from pyhtmx_gui.event_sender import (
+    EventSender,
+    format_message,
+    format_message_prefix,
+    ROOT_PREFIX,
+    DIALOG_PREFIX,
+)
+
+
+TITLE_PREFIX: bytes = format_message_prefix("title-0001")
+
+
+def event_names(chunk: bytes) -> List[str]:
+    return [
+        frame.split(b"\n", 1)[0].decode()
+        for frame in chunk.split(b"\n\n")
+        if frame
+    ]
+
+
+def test_root_and_parameter_events_keep_first_queued_order() -> None:
+    sender = EventSender()
+    mailbox = sender.listen()
+    sender.send(ROOT_PREFIX, format_message(ROOT_PREFIX, "<div>A</div>"))
+    sender.send(TITLE_PREFIX, format_message(TITLE_PREFIX, "Hello"))
+    sender.send(DIALOG_PREFIX, format_message(DIALOG_PREFIX, "<dialog>"))
+    sender.send(ROOT_PREFIX, format_message(ROOT_PREFIX, "<div>B</div>"))
+    sender.send(TITLE_PREFIX, format_message(TITLE_PREFIX, "World"))
+    chunk = mailbox.get()
+    assert event_names(chunk) == [
+        "event: root",
+        "event: title-0001",
+        "event: dialog",
+        "event: title-0001",
+    ]
+    # The pending root swap was replaced by the latest one, in place
+    assert b"<div>A</div>" not in chunk
+    assert chunk.index(b"<div>B</div>") < chunk.index(b"Hello")
+
+
+def test_parameter_events_are_not_coalesced() -> None:
+    sender = EventSender()
+    mailbox = sender.listen()
+    sender.send_many(
+        [
+            (TITLE_PREFIX, format_message(TITLE_PREFIX, "Hi")),
+            (TITLE_PREFIX, format_message(TITLE_PREFIX, "Hi")),
+        ]
+    )
+    assert mailbox.get().count(b"data: Hi\n\n") == 2
+
+
+def test_unread_listener_is_dropped() -> None:
+    sender = EventSender(max_size=2)
+    sender.listen()
+    for _ in range(3):
+        sender.send(ROOT_PREFIX, format_message(ROOT_PREFIX, "<div/>"))
+    assert not sender._listeners
@@ -0,0 +1,54 @@
+from copy import deepcopy
+from pyhtmx import Div, Span  # type: ignore
+from pyhtmx_gui.utils import clone_tag
+
+
+def build_tree() -> Div:
+    return Div(
+        [
+            Div("Title", _id="title", _class=["text-xl", "font-bold"]),
+            Div(
+                [Span("Page for"), Span("ns1")],
+                _id="text",
+                style={"width": "100vw"},
+                sse_swap="text-0001",
+            ),
+        ],
+        _id="page",
+        _class="flex flex-col",
+    )
+
+
+def test_clone_tag_renders_like_deepcopy() -> None:
+    tree = build_tree()
+    assert clone_tag(tree).to_string() == deepcopy(tree).to_string()
+
+
+def test_clone_tag_renders_nested_tag_like_deepcopy() -> None:
+    tree = build_tree()
+    inner = tree.children[1]
+    assert clone_tag(inner).to_string() == deepcopy(inner).to_string()
+
+
+def test_clone_tag_keeps_tree_links() -> None:
+    clone = clone_tag(build_tree())
+    for child in clone.children:
+        assert child.parent is clone
+    assert [c._element for c in clone.children] == list(clone._element)
+
+
+def test_clone_tag_is_independent_of_source() -> None:
+    tree = build_tree()
+    before = tree.to_string()
+    clone = clone_tag(tree)
+    title = clone.children[0]
+    title.update_attributes(
+        text_content="Changed",
+        attributes={"class": ["hidden"]},
+    )
+    clone.children[1].update_attributes(
+        attributes={"style": {"width": "50vw"}},
+        incremental=True,
+    )
+    assert tree.to_string() == before
+    assert clone.to_string() != before